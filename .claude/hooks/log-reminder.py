@@ -13,6 +13,8 @@ Usage (in .claude/settings.json):
 """
 
 import json
+import os
+import struct
 import sys
 import hashlib
 from pathlib import Path
@@ -21,6 +23,9 @@ from datetime import datetime
 THRESHOLD = 15
 STATE_DIR = Path("/tmp/claude-log-reminder")
 
+# Fixed-layout state record: counter, last_mtime, reminded, no_log_reminded
+STATE_LAYOUT = struct.Struct("<Qd??")
+
 
 def get_project_dir():
     """Get project directory from stdin JSON or environment."""
@@ -40,35 +45,57 @@ def get_project_dir():
 def get_state_path(project_dir: str) -> Path:
     """Return a project-keyed state file path."""
     project_hash = hashlib.md5(project_dir.encode()).hexdigest()[:12]
-    return STATE_DIR / f"{project_hash}.json"
+    return STATE_DIR / f"{project_hash}.bin"
 
 
 def load_state(state_path: Path) -> dict:
     """Load persisted state, or return defaults."""
     try:
-        return json.loads(state_path.read_text())
-    except (FileNotFoundError, json.JSONDecodeError):
+        counter, last_mtime, reminded, no_log_reminded = STATE_LAYOUT.unpack(
+            state_path.read_bytes()
+        )
+        return {
+            "counter": counter,
+            "last_mtime": last_mtime,
+            "reminded": reminded,
+            "no_log_reminded": no_log_reminded,
+        }
+    except (FileNotFoundError, struct.error):
         return {"counter": 0, "last_mtime": 0.0, "reminded": False, "no_log_reminded": False}
 
 
 def save_state(state_path: Path, state: dict):
     """Persist state to disk."""
-    STATE_DIR.mkdir(parents=True, exist_ok=True)
-    state_path.write_text(json.dumps(state))
+    state_path.write_bytes(STATE_LAYOUT.pack(
+        state["counter"],
+        state["last_mtime"],
+        state["reminded"],
+        state["no_log_reminded"],
+    ))
 
 
 def find_latest_log(project_dir: str) -> tuple[Path | None, float]:
-    """Find the most recently modified .md file in session_logs/."""
+    """Find the most recently modified .md file in session_logs/.
+
+    Always scans the directory: appending to an older log changes only that
+    file's mtime, so no directory-level cache can tell which log is newest.
+    """
     log_dir = Path(project_dir) / "quality_reports" / "session_logs"
     if not log_dir.is_dir():
         return None, 0.0
 
-    md_files = list(log_dir.glob("*.md"))
-    if not md_files:
-        return None, 0.0
+    # Single pass: one stat per entry, no intermediate list of Paths
+    best_name, best_mtime = None, -1.0
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".md") and entry.is_file():
+                mtime = entry.stat().st_mtime
+                if mtime > best_mtime:
+                    best_name, best_mtime = entry.name, mtime
 
-    latest = max(md_files, key=lambda f: f.stat().st_mtime)
-    return latest, latest.stat().st_mtime
+    if best_name is None:
+        return None, 0.0
+    return log_dir / best_name, best_mtime
 
 
 def main():
@@ -76,6 +103,7 @@ def main():
     if not project_dir:
         sys.exit(0)
 
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
     state_path = get_state_path(project_dir)
     state = load_state(state_path)
 
@@ -101,7 +129,7 @@ def main():
 
     # Case 2: Log was updated since last check — reset everything
     if current_mtime != state["last_mtime"]:
-        state = {"counter": 0, "last_mtime": current_mtime, "reminded": False, "no_log_reminded": False}
+        state.update(counter=0, last_mtime=current_mtime, reminded=False, no_log_reminded=False)
         save_state(state_path, state)
         sys.exit(0)
 
@@ -14,10 +14,18 @@ Usage:
 
 import sys
 import argparse
+import collections
+import contextlib
+import functools
 import subprocess
+import textwrap
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import re
+import ast
 import json
 
 # ==============================================================================
@@ -69,184 +77,238 @@ THRESHOLDS = {
 # ISSUE DETECTION
 # ==============================================================================
 
+# Patterns are compiled once at import and shared by every IssueDetector.scan().
+# They are pure ASCII, so they run on the raw file bytes without decoding.
+_CRED_RE = re.compile(
+    rb'(?:password|api_key|secret)\s*=\s*["\']'
+    rb'|token\s*=\s*["\'](?!\{)',  # exclude template strings
+    re.IGNORECASE,
+)
+_COMMENT_RE = re.compile(rb'\s*(?:#|//)')
+_ABS_PATH_RE = re.compile(rb'["\'][/\\]|["\'][A-Za-z]:[/\\]')
+_ALLOWED_PATH_RE = re.compile(rb'http:|https:|file://|/tmp/|/dev/')
+
+_DEFINITION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+# Parses each file passed as a trailing argument; prints "<index>\t<error or empty>"
+_R_BATCH_PARSE = (
+    "files <- commandArgs(TRUE); "
+    "for (i in seq_along(files)) { "
+    "r <- try(parse(files[i]), silent = TRUE); "
+    "msg <- if (inherits(r, 'try-error')) "
+    "gsub('\\n', ' ', conditionMessage(attr(r, 'condition'))) else ''; "
+    "cat(sprintf('%d\\t%s\\n', i, msg)) }"
+)
+
+
 class IssueDetector:
     """Detect common issues for quality scoring."""
 
     @staticmethod
-    def check_python_syntax(filepath: Path) -> Tuple[bool, str]:
-        """Check if Python file has syntax errors."""
+    def parse_python(
+        content: bytes, filepath: Path
+    ) -> Tuple[Optional[ast.Module], str]:
+        """Parse and compile Python source in-process.
+
+        Returns the module AST, or None and the error message when the source
+        does not compile. The source is parsed once and the tree is reused.
+        """
         try:
-            result = subprocess.run(
-                [sys.executable, '-m', 'py_compile', str(filepath)],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                return False, result.stderr
-            return True, ""
-        except subprocess.TimeoutExpired:
-            return False, "Syntax check timeout"
+            # Compiler warnings (e.g. invalid escapes) are not scored; keep
+            # them off the report output
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                tree = ast.parse(content, str(filepath))
+                # Catches compile-time errors the parser accepts, e.g. a
+                # 'return' outside a function
+                compile(tree, str(filepath), 'exec')
+        except SyntaxError as e:
+            return None, f"{e.msg} at line {e.lineno}"
+        except ValueError as e:
+            # Source containing null bytes
+            return None, str(e)
+        return tree, ""
 
     @staticmethod
-    def check_python_type_hints(content: str) -> List[int]:
-        """Detect public functions missing type hints."""
-        issues = []
-        lines = content.split('\n')
-        for i, line in enumerate(lines, 1):
-            # Match function definitions that don't start with _
-            match = re.match(r'\s*def\s+([a-zA-Z][a-zA-Z0-9_]*)\s*\(', line)
-            if match and not match.group(1).startswith('_'):
-                # Check if return type annotation exists
-                if '->' not in line:
-                    issues.append(i)
-        return issues
+    def check_definitions(tree: ast.AST) -> Dict[str, List[int]]:
+        """Detect public definitions missing return hints or docstrings.
 
-    @staticmethod
-    def check_hardcoded_paths(content: str) -> List[int]:
-        """Detect absolute paths in code."""
-        issues = []
-        lines = content.split('\n')
-        for i, line in enumerate(lines, 1):
-            if re.search(r'["\'][/\\]|["\'][A-Za-z]:[/\\]', line):
-                if not re.search(r'http:|https:|file://|/tmp/|/dev/', line):
-                    issues.append(i)
-        return issues
+        Returns a dict mapping issue type (missing_type_hints,
+        missing_docstring) to the line numbers where it occurs.
+        """
+        found = {
+            'missing_type_hints': [],
+            'missing_docstring': [],
+        }
+        for node in ast.walk(tree):
+            if not isinstance(node, _DEFINITION_NODES) or node.name.startswith('_'):
+                continue
+            if not isinstance(node, ast.ClassDef) and node.returns is None:
+                found['missing_type_hints'].append(node.lineno)
+            if ast.get_docstring(node) is None:
+                found['missing_docstring'].append(node.lineno)
+        # ast.walk is breadth-first; report in source order
+        for lines in found.values():
+            lines.sort()
+        return found
 
     @staticmethod
-    def check_hardcoded_credentials(content: str) -> List[int]:
-        """Detect potential hardcoded credentials."""
-        issues = []
-        lines = content.split('\n')
-        patterns = [
-            r'password\s*=\s*["\']',
-            r'api_key\s*=\s*["\']',
-            r'secret\s*=\s*["\']',
-            r'token\s*=\s*["\'](?!{)',  # exclude template strings
-        ]
+    def scan(lines: List[bytes]) -> Dict[str, List[int]]:
+        """Detect line-level issues in a single pass over the source lines.
+
+        Returns a dict mapping issue type (hardcoded_credentials,
+        hardcoded_path) to the line numbers where it occurs.
+        """
+        found = {
+            'hardcoded_credentials': [],
+            'hardcoded_path': [],
+        }
         for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            if stripped.startswith('#') or stripped.startswith('//'):
+            # Both patterns need a quote, and credentials also need '=', so
+            # lines without them are rejected before entering the regex engine
+            if b'"' not in line and b"'" not in line:
                 continue
-            for pattern in patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    issues.append(i)
-                    break
-        return issues
 
-    @staticmethod
-    def check_missing_docstrings(content: str) -> List[int]:
-        """Detect public functions/classes missing docstrings."""
-        issues = []
-        lines = content.split('\n')
-        for i, line in enumerate(lines, 1):
-            match = re.match(r'\s*(def|class)\s+([a-zA-Z][a-zA-Z0-9_]*)', line)
-            if match and not match.group(2).startswith('_'):
-                # Check next non-empty line for docstring
-                for j in range(i, min(i + 3, len(lines))):
-                    next_line = lines[j].strip()
-                    if next_line and next_line != '':
-                        if not (next_line.startswith('"""') or next_line.startswith("'''")):
-                            issues.append(i)
-                        break
-        return issues
+            # Credentials (comments excluded)
+            if b'=' in line and not _COMMENT_RE.match(line) and _CRED_RE.search(line):
+                found['hardcoded_credentials'].append(i)
+
+            # Absolute paths
+            if _ABS_PATH_RE.search(line) and not _ALLOWED_PATH_RE.search(line):
+                found['hardcoded_path'].append(i)
+        return found
 
     @staticmethod
     def check_r_syntax(filepath: Path) -> Tuple[bool, str]:
         """Check R script for syntax errors."""
+        return IssueDetector.check_r_syntax_batch([filepath])[filepath]
+
+    @staticmethod
+    def check_r_syntax_batch(filepaths: List[Path]) -> Dict[Path, Tuple[bool, str]]:
+        """Check several R scripts for syntax errors in one Rscript process.
+
+        R startup dominates a per-file parse(), so all files are passed as
+        arguments to a single interpreter that reports one line per file.
+        """
         try:
             result = subprocess.run(
-                ['Rscript', '-e', f'parse("{filepath}")'],
+                ['Rscript', '-e', _R_BATCH_PARSE, *map(str, filepaths)],
                 capture_output=True,
                 text=True,
-                timeout=10
+                timeout=10 * len(filepaths)
             )
-            if result.returncode != 0:
-                return False, result.stderr
-            return True, ""
         except subprocess.TimeoutExpired:
-            return False, "Syntax check timeout"
+            return {fp: (False, "Syntax check timeout") for fp in filepaths}
         except FileNotFoundError:
-            return False, "Rscript not installed"
+            return {fp: (False, "Rscript not installed") for fp in filepaths}
+
+        results = {}
+        for line in result.stdout.splitlines():
+            index, _, error = line.partition('\t')
+            if index.isdigit() and 0 < int(index) <= len(filepaths):
+                results[filepaths[int(index) - 1]] = (not error, error)
+        # Files without a status line (e.g. Rscript crashed) fail with stderr
+        for fp in filepaths:
+            results.setdefault(fp, (False, result.stderr))
+        return results
 
 
 # ==============================================================================
 # QUALITY SCORER
 # ==============================================================================
 
+@dataclass(slots=True, frozen=True)
+class Issue:
+    """A single detected issue; converted to a dict only when reporting."""
+
+    type: str
+    description: str
+    details: str
+    points: int
+
+
 class QualityScorer:
     """Calculate quality scores for project files."""
 
-    def __init__(self, filepath: Path, verbose: bool = False):
+    def __init__(
+        self,
+        filepath: Path,
+        verbose: bool = False,
+        precomputed_syntax: Optional[Tuple[bool, str]] = None,
+    ):
         self.filepath = filepath
         self.verbose = verbose
+        # Syntax result from a batched check (R only); skips the per-file check
+        self.precomputed_syntax = precomputed_syntax
         self.score = 100
-        self.issues = {
+        self.issues: Dict[str, List[Issue]] = {
             'critical': [],
             'major': [],
             'minor': []
         }
         self.auto_fail = False
+        self._report_cache: Optional[Dict] = None
 
     def score_python(self) -> Dict:
         """Score Python module quality."""
-        content = self.filepath.read_text(encoding='utf-8')
+        self._report_cache = None
+        content = self.filepath.read_bytes()
+        lines = content.splitlines()
 
         # Check syntax
-        is_valid, error = IssueDetector.check_python_syntax(self.filepath)
-        if not is_valid:
+        tree, error = IssueDetector.parse_python(content, self.filepath)
+        if tree is None:
             self.auto_fail = True
-            self.issues['critical'].append({
-                'type': 'import_error',
-                'description': 'Python syntax/import error',
-                'details': error[:200],
-                'points': 100
-            })
+            self.issues['critical'].append(Issue(
+                type='import_error',
+                description='Python syntax/import error',
+                details=error[:200],
+                points=100
+            ))
             self.score = 0
             return self._generate_report()
 
+        found = IssueDetector.check_definitions(tree)
+        found.update(IssueDetector.scan(lines))
+
         # Check type hints
-        type_hint_issues = IssueDetector.check_python_type_hints(content)
-        for line in type_hint_issues:
-            self.issues['critical'].append({
-                'type': 'missing_type_hints',
-                'description': f'Public function missing return type hint at line {line}',
-                'details': 'Add -> ReturnType annotation',
-                'points': 15
-            })
+        for line in found['missing_type_hints']:
+            self.issues['critical'].append(Issue(
+                type='missing_type_hints',
+                description=f'Public function missing return type hint at line {line}',
+                details='Add -> ReturnType annotation',
+                points=15
+            ))
             self.score -= 15
 
         # Check hardcoded credentials
-        cred_issues = IssueDetector.check_hardcoded_credentials(content)
-        for line in cred_issues:
-            self.issues['critical'].append({
-                'type': 'hardcoded_credentials',
-                'description': f'Potential hardcoded credential at line {line}',
-                'details': 'Use environment variables or config files',
-                'points': 20
-            })
+        for line in found['hardcoded_credentials']:
+            self.issues['critical'].append(Issue(
+                type='hardcoded_credentials',
+                description=f'Potential hardcoded credential at line {line}',
+                details='Use environment variables or config files',
+                points=20
+            ))
             self.score -= 20
 
         # Check hardcoded paths
-        path_issues = IssueDetector.check_hardcoded_paths(content)
-        for line in path_issues:
-            self.issues['major'].append({
-                'type': 'hardcoded_path',
-                'description': f'Hardcoded absolute path at line {line}',
-                'details': 'Use relative paths or config',
-                'points': 5
-            })
+        for line in found['hardcoded_path']:
+            self.issues['major'].append(Issue(
+                type='hardcoded_path',
+                description=f'Hardcoded absolute path at line {line}',
+                details='Use relative paths or config',
+                points=5
+            ))
             self.score -= 5
 
         # Check docstrings
-        doc_issues = IssueDetector.check_missing_docstrings(content)
-        for line in doc_issues:
-            self.issues['minor'].append({
-                'type': 'missing_docstring',
-                'description': f'Missing docstring at line {line}',
-                'details': 'Add Google-style docstring',
-                'points': 1
-            })
+        for line in found['missing_docstring']:
+            self.issues['minor'].append(Issue(
+                type='missing_docstring',
+                description=f'Missing docstring at line {line}',
+                details='Add Google-style docstring',
+                points=1
+            ))
             self.score -= 1
 
         self.score = max(0, self.score)
@@ -254,49 +316,59 @@ class QualityScorer:
 
     def score_r_script(self) -> Dict:
         """Score R script quality."""
-        content = self.filepath.read_text(encoding='utf-8')
+        self._report_cache = None
+        content = self.filepath.read_bytes()
+        lines = content.splitlines()
 
         # Check syntax
-        is_valid, error = IssueDetector.check_r_syntax(self.filepath)
+        if self.precomputed_syntax is not None:
+            is_valid, error = self.precomputed_syntax
+        else:
+            is_valid, error = IssueDetector.check_r_syntax(self.filepath)
         if not is_valid:
             self.auto_fail = True
-            self.issues['critical'].append({
-                'type': 'syntax_error',
-                'description': 'R syntax error',
-                'details': error[:200],
-                'points': 100
-            })
+            self.issues['critical'].append(Issue(
+                type='syntax_error',
+                description='R syntax error',
+                details=error[:200],
+                points=100
+            ))
             self.score = 0
             return self._generate_report()
 
         # Check hardcoded paths
-        path_issues = IssueDetector.check_hardcoded_paths(content)
-        for line in path_issues:
-            self.issues['critical'].append({
-                'type': 'hardcoded_path',
-                'description': f'Hardcoded absolute path at line {line}',
-                'details': 'Use relative paths or here::here()',
-                'points': 20
-            })
+        for line in IssueDetector.scan(lines)['hardcoded_path']:
+            self.issues['critical'].append(Issue(
+                type='hardcoded_path',
+                description=f'Hardcoded absolute path at line {line}',
+                details='Use relative paths or here::here()',
+                points=20
+            ))
             self.score -= 20
 
         # Check for set.seed() if randomness detected
-        has_random = any(fn in content for fn in ['rnorm', 'runif', 'sample', 'rbinom', 'rnbinom'])
-        has_seed = 'set.seed' in content
+        has_random = any(fn in content for fn in [b'rnorm', b'runif', b'sample', b'rbinom', b'rnbinom'])
+        has_seed = b'set.seed' in content
         if has_random and not has_seed:
-            self.issues['major'].append({
-                'type': 'missing_set_seed',
-                'description': 'Missing set.seed() for reproducibility',
-                'details': 'Add set.seed(YYYYMMDD) after library() calls',
-                'points': 10
-            })
+            self.issues['major'].append(Issue(
+                type='missing_set_seed',
+                description='Missing set.seed() for reproducibility',
+                details='Add set.seed(YYYYMMDD) after library() calls',
+                points=10
+            ))
             self.score -= 10
 
         self.score = max(0, self.score)
         return self._generate_report()
 
     def _generate_report(self) -> Dict:
-        """Generate quality score report."""
+        """Return the quality score report, building it on first use."""
+        if self._report_cache is None:
+            self._report_cache = self._build_report()
+        return self._report_cache
+
+    def _build_report(self) -> Dict:
+        """Build quality score report from the current score and issues."""
         if self.auto_fail:
             status = 'FAIL'
             threshold = 'None (auto-fail)'
@@ -325,9 +397,9 @@ class QualityScorer:
             'threshold': threshold,
             'auto_fail': self.auto_fail,
             'issues': {
-                'critical': self.issues['critical'],
-                'major': self.issues['major'],
-                'minor': self.issues['minor'],
+                'critical': [asdict(issue) for issue in self.issues['critical']],
+                'major': [asdict(issue) for issue in self.issues['major']],
+                'minor': [asdict(issue) for issue in self.issues['minor']],
                 'counts': {
                     'critical': critical_count,
                     'major': major_count,
@@ -416,6 +488,20 @@ class QualityScorer:
 # CLI INTERFACE
 # ==============================================================================
 
+def _score_one(
+    filepath: Path,
+    verbose: bool,
+    precomputed_syntax: Optional[Tuple[bool, str]] = None,
+) -> QualityScorer:
+    """Score a single file; runs in a worker process for multi-file runs."""
+    scorer = QualityScorer(filepath, verbose=verbose, precomputed_syntax=precomputed_syntax)
+    if filepath.suffix == '.py':
+        scorer.score_python()
+    else:
+        scorer.score_r_script()
+    return scorer
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Calculate quality scores for NutriGene AI project files',
@@ -456,44 +542,69 @@ Exit Codes:
 
     args = parser.parse_args()
 
-    results = []
     exit_code = 0
 
+    to_score = []
     for filepath in args.filepaths:
         if not filepath.exists():
             print(f"Error: File not found: {filepath}")
             exit_code = 1
-            continue
-
-        try:
-            scorer = QualityScorer(filepath, verbose=args.verbose)
-
-            if filepath.suffix == '.py':
-                report = scorer.score_python()
-            elif filepath.suffix == '.R':
-                report = scorer.score_r_script()
-            else:
-                print(f"Error: Unsupported file type: {filepath.suffix} (supported: .py, .R)")
-                continue
-
-            results.append(report)
-
-            if not args.json:
-                scorer.print_report(summary_only=args.summary)
+        elif filepath.suffix not in ('.py', '.R'):
+            print(f"Error: Unsupported file type: {filepath.suffix} (supported: .py, .R)")
+        else:
+            to_score.append(filepath)
 
-            if report['auto_fail']:
-                exit_code = max(exit_code, 2)
-            elif report['score'] < THRESHOLDS['commit']:
-                exit_code = max(exit_code, 1)
+    # Syntax-check all R files in a single Rscript process up front
+    r_files = [fp for fp in to_score if fp.suffix == '.R']
+    r_syntax = IssueDetector.check_r_syntax_batch(r_files) if len(r_files) > 1 else {}
 
-        except Exception as e:
-            print(f"Error scoring {filepath}: {e}")
-            import traceback
-            traceback.print_exc()
-            exit_code = 1
+    # JSON reports are streamed as a pretty-printed array, one element per
+    # file as soon as it is scored, rather than collected and dumped at the end
+    first_report = True
+    if args.json:
+        sys.stdout.write('[')
+
+    with contextlib.ExitStack() as stack:
+        # Files are scored independently, so multi-file runs fan out to a
+        # process pool; a single file is scored inline to skip pool startup.
+        if len(to_score) > 1:
+            executor = stack.enter_context(ProcessPoolExecutor())
+            # Futures are popped as they are consumed so each finished scorer
+            # is released once reported instead of living until the loop ends
+            pending = collections.deque(
+                executor.submit(_score_one, fp, args.verbose, r_syntax.get(fp))
+                for fp in to_score
+            )
+            outcomes = ((fp, pending.popleft().result) for fp in to_score)
+        else:
+            outcomes = ((fp, functools.partial(_score_one, fp, args.verbose)) for fp in to_score)
+
+        for filepath, get_scorer in outcomes:
+            try:
+                scorer = get_scorer()
+                report = scorer._generate_report()
+
+                if args.json:
+                    sys.stdout.write('\n' if first_report else ',\n')
+                    sys.stdout.write(textwrap.indent(json.dumps(report, indent=2), '  '))
+                    sys.stdout.flush()
+                    first_report = False
+                else:
+                    scorer.print_report(summary_only=args.summary)
+
+                if report['auto_fail']:
+                    exit_code = max(exit_code, 2)
+                elif report['score'] < THRESHOLDS['commit']:
+                    exit_code = max(exit_code, 1)
+
+            except Exception as e:
+                print(f"Error scoring {filepath}: {e}", file=sys.stderr)
+                import traceback
+                traceback.print_exc()
+                exit_code = 1
 
     if args.json:
-        print(json.dumps(results, indent=2))
+        print(']' if first_report else '\n]')
 
     sys.exit(exit_code)
 
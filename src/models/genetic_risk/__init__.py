@@ -4,24 +4,17 @@ Public API:
     create_engine() — Build a ready-to-use RecommendationEngine.
     generate_report() — One-call shortcut: profile in, report out.
     GeneNutrientKnowledgeBase — Load and query gene-nutrient knowledge.
+    load_knowledge_base() — Shared knowledge base per config directory.
     RiskScoringEngine — Calculate genetic risk scores.
     RecommendationEngine — Generate personalized dietary recommendations.
     GeneticProfile — Individual genotype data model.
     GeneticRiskReport — Complete risk assessment report.
 """
 
-import sys
+import functools
 from pathlib import Path
 from typing import List, Optional
 
-# Enable UTF-8 stdout on Windows so Chinese characters display correctly.
-# This must run before any print() calls; does not affect conda run pipes.
-if sys.platform == "win32" and hasattr(sys.stdout, "reconfigure"):
-    try:
-        sys.stdout.reconfigure(encoding="utf-8")
-    except Exception:
-        pass
-
 from .data_models import (
     DietaryRecommendation,
     EffectSize,
@@ -32,7 +25,7 @@ from .data_models import (
     SNPGenotype,
     Zygosity,
 )
-from .knowledge_base import GeneNutrientKnowledgeBase
+from .knowledge_base import GeneNutrientKnowledgeBase, load_knowledge_base
 from .recommendation import RecommendationEngine
 from .risk_scoring import RiskScoringEngine
 from .validators import GeneticDataValidator
@@ -49,6 +42,9 @@ def create_engine(
 ) -> RecommendationEngine:
     """Build a ready-to-use RecommendationEngine with default configs.
 
+    The knowledge base is shared between engines for the same kb_dir
+    (see load_knowledge_base); the DRI config is loaded per engine.
+
     Args:
         kb_dir: Path to gene_nutrient_kb/ directory. Defaults to configs/gene_nutrient_kb/.
         dri_path: Path to chinese_dri.yaml. Defaults to configs/chinese_dri.yaml.
@@ -58,7 +54,7 @@ def create_engine(
     """
     kb_dir = kb_dir or _KB_DIR
     dri_path = dri_path or _DRI_PATH
-    kb = GeneNutrientKnowledgeBase(kb_dir)
+    kb = load_knowledge_base(kb_dir)
     scorer = RiskScoringEngine(kb)
     return RecommendationEngine(kb, scorer, dri_path)
 
@@ -73,6 +69,9 @@ def generate_report(
 ) -> GeneticRiskReport:
     """One-call shortcut: profile in, report out.
 
+    The engine (knowledge base + DRI config) is built once per resolved
+    config-path pair and reused across calls.
+
     Args:
         profile: Individual genetic profile.
         age: Age in years.
@@ -84,13 +83,22 @@ def generate_report(
     Returns:
         Complete GeneticRiskReport.
     """
-    engine = create_engine(kb_dir=kb_dir, dri_path=dri_path)
+    engine = _cached_engine(
+        Path(kb_dir or _KB_DIR).resolve(), Path(dri_path or _DRI_PATH).resolve()
+    )
     return engine.generate_report(profile, age, sex, traits)
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_engine(kb_dir: Path, dri_path: Path) -> RecommendationEngine:
+    """Build an engine once per resolved (kb_dir, dri_path) pair."""
+    return create_engine(kb_dir=kb_dir, dri_path=dri_path)
+
+
 __all__ = [
     "create_engine",
     "generate_report",
+    "load_knowledge_base",
     "DietaryRecommendation",
     "EffectSize",
     "GeneNutrientPair",
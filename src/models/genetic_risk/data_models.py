@@ -8,9 +8,19 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Literal, Optional
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 
 class Zygosity(str, Enum):
@@ -45,6 +55,10 @@ class SNPGenotype(BaseModel):
         return v
 
 
+# Validates a whole list of genotype records in a single pydantic-core call
+_GENOTYPE_LIST_ADAPTER = TypeAdapter(List[SNPGenotype])
+
+
 class GeneticProfile(BaseModel):
     """Complete genetic profile for an individual."""
 
@@ -54,6 +68,52 @@ class GeneticProfile(BaseModel):
     data_source: str = Field("unknown", description="e.g., 'WGS', 'SNP_Array', 'DTC'")
     collection_date: Optional[str] = Field(None, description="ISO 8601 date")
 
+    @classmethod
+    def from_records(
+        cls,
+        records: Union[str, bytes, Sequence[Dict[str, Any]]],
+        **fields: Any,
+    ) -> GeneticProfile:
+        """Build a profile from raw genotype records in one validation pass.
+
+        Args:
+            records: JSON array (str or bytes) or sequence of dicts with
+                SNPGenotype fields.
+            **fields: Remaining GeneticProfile fields (individual_id, ...).
+
+        Returns:
+            Validated GeneticProfile.
+
+        Raises:
+            ValidationError: If any record or profile field is invalid.
+        """
+        if isinstance(records, (str, bytes)):
+            genotypes = _GENOTYPE_LIST_ADAPTER.validate_json(records)
+        else:
+            genotypes = _GENOTYPE_LIST_ADAPTER.validate_python(records)
+        return cls(genotypes=genotypes, **fields)
+
+    # Lookups are computed from the current genotypes on every call rather
+    # than cached: callers may edit or replace genotype records in place.
+
+    def rsids(self) -> FrozenSet[str]:
+        """Build the set of rsIDs in this profile.
+
+        Like genotypes_by_rsid(), build it once when testing several rsIDs.
+        """
+        return frozenset([g.rsid for g in self.genotypes])
+
+    def genotypes_by_rsid(self) -> Dict[str, SNPGenotype]:
+        """Build an rsID -> genotype index (first occurrence wins).
+
+        Build it once and reuse it when looking up several rsIDs; it is a
+        snapshot and does not track later edits to the profile.
+        """
+        index: Dict[str, SNPGenotype] = {}
+        for g in self.genotypes:
+            index.setdefault(g.rsid, g)
+        return index
+
     def get_genotype_by_rsid(self, rsid: str) -> Optional[SNPGenotype]:
         """Retrieve genotype for a specific rsID."""
         for g in self.genotypes:
@@ -103,6 +163,13 @@ class GeneNutrientPair(BaseModel):
     pubmed_ids: List[str] = Field(default_factory=list)
 
 
+# Output models. The scoring and recommendation engines build these with
+# model_construct(): every field comes from a validated GeneticProfile or
+# GeneNutrientPair, from recommendation rules and DRI values validated when
+# RecommendationEngine is created, or from engine-computed values. Direct
+# construction and model_validate() still run full validation.
+
+
 class RiskScore(BaseModel):
     """Genetic risk score for a specific trait."""
 
@@ -110,7 +177,7 @@ class RiskScore(BaseModel):
     score: float = Field(..., description="Normalized risk score (z-score)")
     percentile: Optional[float] = Field(None, ge=0, le=100)
     risk_category: Literal["low", "moderate", "high"] = "moderate"
-    contributing_variants: List[str] = Field(
+    contributing_variants: Tuple[str, ...] = Field(
         ..., description="List of rsIDs included"
     )
     confidence: Literal["high", "medium", "low"] = "medium"
@@ -156,8 +223,8 @@ class GeneticRiskReport(BaseModel):
     population: str = "han_chinese"
     risk_scores: List[RiskScore] = Field(default_factory=list)
     recommendations: List[DietaryRecommendation] = Field(default_factory=list)
-    missing_variants: List[str] = Field(
-        default_factory=list,
+    missing_variants: Tuple[str, ...] = Field(
+        default=(),
         description="rsIDs not found in individual profile",
     )
     limitations: List[str] = Field(default_factory=lambda: list(_DEFAULT_LIMITATIONS))
@@ -5,9 +5,11 @@ for Chinese population nutrigenomics: MTHFR, FTO, MC4R, APOE, FADS1/2,
 TCF7L2, BCMO1, ADIPOQ, FGF21, VDR.
 """
 
+import functools
 import logging
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import ValidationError
 
@@ -35,6 +37,9 @@ class GeneNutrientKnowledgeBase:
         self._genes: Dict[str, dict] = {}
         self._allele_frequencies: Dict[str, dict] = {}
         self._recommendations: Dict[str, dict] = {}
+        self._rsid_to_pair: Dict[str, GeneNutrientPair] = {}
+        self._gene_to_pairs: Dict[str, Tuple[GeneNutrientPair, ...]] = {}
+        self._tracked_rsids: Tuple[str, ...] = ()
         self._load()
 
     def _load(self) -> None:
@@ -55,6 +60,8 @@ class GeneNutrientKnowledgeBase:
         for variant_id, vdata in variants.items():
             self._build_pair(variant_id, vdata, effect_sizes)
 
+        self._build_indices()
+
         logger.info(
             "Loaded %d gene-nutrient pairs from %s",
             len(self._pairs),
@@ -94,22 +101,30 @@ class GeneNutrientKnowledgeBase:
                 f"Variant {variant_id} validation failed: {e}"
             ) from e
 
+    def _build_indices(self) -> None:
+        """Index loaded pairs by rsID and gene in a single pass."""
+        gene_to_pairs: Dict[str, List[GeneNutrientPair]] = defaultdict(list)
+        for pair in self._pairs.values():
+            self._rsid_to_pair.setdefault(pair.variant_rsid, pair)
+            gene_to_pairs[pair.gene].append(pair)
+        self._gene_to_pairs = {
+            gene: tuple(pairs) for gene, pairs in gene_to_pairs.items()
+        }
+        self._tracked_rsids = tuple(p.variant_rsid for p in self._pairs.values())
+
     # -- Query methods --
 
     def get_pair_by_rsid(self, rsid: str) -> Optional[GeneNutrientPair]:
         """Retrieve gene-nutrient pair by rsID."""
-        for pair in self._pairs.values():
-            if pair.variant_rsid == rsid:
-                return pair
-        return None
+        return self._rsid_to_pair.get(rsid)
 
-    def get_pairs_by_gene(self, gene: str) -> List[GeneNutrientPair]:
+    def get_pairs_by_gene(self, gene: str) -> Tuple[GeneNutrientPair, ...]:
         """Retrieve all variant pairs for a specific gene symbol."""
-        return [p for p in self._pairs.values() if p.gene == gene]
+        return self._gene_to_pairs.get(gene, ())
 
     def get_all_tracked_rsids(self) -> List[str]:
         """Return all rsIDs tracked in the knowledge base."""
-        return [p.variant_rsid for p in self._pairs.values()]
+        return list(self._tracked_rsids)
 
     def get_all_variant_ids(self) -> List[str]:
         """Return all internal variant identifiers (e.g., 'MTHFR_C677T')."""
@@ -141,3 +156,29 @@ class GeneNutrientKnowledgeBase:
     def gene_count(self) -> int:
         """Number of unique genes loaded."""
         return len(self._genes)
+
+
+def load_knowledge_base(config_dir: Path) -> GeneNutrientKnowledgeBase:
+    """Return a shared knowledge base for a config directory.
+
+    The knowledge base is read-only after loading, so one instance per
+    resolved directory is built and reused. Edits to the YAML files are not
+    picked up until the process restarts; construct GeneNutrientKnowledgeBase
+    directly for a fresh load.
+
+    Args:
+        config_dir: Path to configs/gene_nutrient_kb/ directory.
+
+    Returns:
+        Loaded GeneNutrientKnowledgeBase.
+
+    Raises:
+        KnowledgeBaseError: If configs are missing or invalid.
+    """
+    return _load_knowledge_base(Path(config_dir).resolve())
+
+
+@functools.lru_cache(maxsize=4)
+def _load_knowledge_base(config_dir: Path) -> GeneNutrientKnowledgeBase:
+    """Build a knowledge base once per resolved config directory."""
+    return GeneNutrientKnowledgeBase(config_dir)
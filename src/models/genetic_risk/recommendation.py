@@ -5,13 +5,15 @@ Reference Intakes (2022) as baseline, adjusted by individual genetic
 risk profiles.
 """
 
+import bisect
 import logging
-from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Literal, Mapping, Optional, Tuple
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from src.utils.config_loader import load_yaml_config
-from src.utils.exceptions import RecommendationError
+from src.utils.exceptions import ConfigValidationError, RecommendationError
 
 from .data_models import DietaryRecommendation, GeneticProfile, GeneticRiskReport, RiskScore
 from .knowledge_base import GeneNutrientKnowledgeBase
@@ -23,6 +25,52 @@ logger = logging.getLogger(__name__)
 # Priority sort order
 _PRIORITY_ORDER = {"critical": 4, "high": 3, "medium": 2, "low": 1}
 
+# Map recommendation nutrient names to DRI config keys
+_NUTRIENT_TO_DRI_KEY: Mapping[str, str] = {
+    "folate": "folate",
+    "energy_balance": "energy",
+    "dietary_fat": "dietary_fat",
+    "omega3_omega6": "omega3_epa_dha",
+    "carbohydrate": "carbohydrate",
+    "vitamin_a": "vitamin_a",
+    "insulin_sensitivity": "protein",  # proxy: general metabolic
+    "macronutrient_preference": "carbohydrate",
+    "vitamin_d_calcium": "vitamin_d",
+}
+
+
+class _RuleTier(BaseModel):
+    """One risk tier of a gene's rules in recommendations.yaml."""
+
+    dri_multiplier: float = 1.0
+    description: str = ""
+    supplementation: str = ""
+    food_sources: List[str] = Field(default_factory=list)
+    priority: Literal["critical", "high", "medium", "low"] = "medium"
+
+
+class _GeneRules(BaseModel):
+    """A gene's recommendation rules, validated once at engine init."""
+
+    nutrient: Optional[str] = None
+    high_risk: Optional[_RuleTier] = None
+    moderate_risk: Optional[_RuleTier] = None
+    low_risk: Optional[_RuleTier] = None
+
+
+# Validate DRI config values the way DietaryRecommendation fields would
+_DRI_VALUE_ADAPTER = TypeAdapter(float)
+_DRI_UNIT_ADAPTER = TypeAdapter(str)
+
+# Per-trait (rsIDs, gene key, recommendation rules), see _build_trait_plan
+_TraitPlan = Tuple[Tuple[str, ...], Optional[str], Optional[_GeneRules]]
+_NO_PLAN: _TraitPlan = ((), None, None)
+
+# Chinese DRI 2022 adult age groups and the first age of each group after
+# the first (see _age_to_group)
+_AGE_GROUPS = ("18_49", "50_64", "65_plus")
+_AGE_GROUP_LOWER_BOUNDS = (50, 65)
+
 
 class RecommendationEngine:
     """Generate personalized dietary recommendations from genetic risk.
@@ -34,6 +82,9 @@ class RecommendationEngine:
         knowledge_base: Loaded GeneNutrientKnowledgeBase.
         scoring_engine: Initialized RiskScoringEngine.
         dri_config_path: Path to configs/chinese_dri.yaml.
+
+    Raises:
+        ConfigValidationError: If recommendation rules or DRI values are invalid.
     """
 
     def __init__(
@@ -45,6 +96,8 @@ class RecommendationEngine:
         self.kb = knowledge_base
         self.scorer = scoring_engine
         self.dri = load_yaml_config(dri_config_path)
+        self._dri_values, self._dri_units = _build_dri_tables(self.dri)
+        self._trait_plan = _build_trait_plan(knowledge_base)
 
     def generate_report(
         self,
@@ -70,15 +123,16 @@ class RecommendationEngine:
             raise RecommendationError(f"Invalid age: {age}")
 
         # Determine which traits to score
-        target_traits = traits if traits else list(TRAIT_VARIANT_MAP.keys())
+        target_traits = traits if traits else self._trait_plan
 
         # Calculate risk scores
-        risk_scores: List[RiskScore] = []
-        for trait in target_traits:
-            rsids = TRAIT_VARIANT_MAP.get(trait, [])
-            result = self.scorer.calculate_polygenic_risk(profile, trait, rsids)
-            if result is not None:
-                risk_scores.append(result)
+        risk_scores = self.scorer.score_traits(
+            profile,
+            [
+                (trait, self._trait_plan.get(trait, _NO_PLAN)[0])
+                for trait in target_traits
+            ],
+        )
 
         # Find missing variants
         all_required = self.kb.get_all_tracked_rsids()
@@ -92,13 +146,12 @@ class RecommendationEngine:
             key=lambda r: _PRIORITY_ORDER.get(r.priority, 0), reverse=True
         )
 
-        return GeneticRiskReport(
+        return GeneticRiskReport.model_construct(
             individual_id=profile.individual_id,
-            generated_date=datetime.now().isoformat(),
             population=profile.population,
             risk_scores=risk_scores,
             recommendations=recommendations,
-            missing_variants=missing,
+            missing_variants=tuple(missing),
         )
 
     def _build_recommendations(
@@ -117,12 +170,11 @@ class RecommendationEngine:
         recommendations: List[DietaryRecommendation] = []
 
         for score in risk_scores:
-            gene_key = TRAIT_GENE_KEY.get(score.trait)
+            _, gene_key, rules = self._trait_plan.get(score.trait, _NO_PLAN)
             if gene_key is None:
                 logger.warning("No gene key mapping for trait %s", score.trait)
                 continue
 
-            rules = self.kb.get_recommendation_rules(gene_key)
             if rules is None:
                 logger.warning("No recommendation rules for gene %s", gene_key)
                 continue
@@ -134,12 +186,12 @@ class RecommendationEngine:
         return recommendations
 
     def _apply_rules(
-        self, rules: dict, score: RiskScore, age: int, sex: str
+        self, rules: _GeneRules, score: RiskScore, age: int, sex: str
     ) -> Optional[DietaryRecommendation]:
         """Apply genotype-specific rules to produce a recommendation.
 
         Args:
-            rules: Recommendation rules from YAML config.
+            rules: Validated recommendation rules for the trait's gene.
             score: RiskScore for the relevant trait.
             age: Age in years.
             sex: 'male' or 'female'.
@@ -149,97 +201,52 @@ class RecommendationEngine:
         """
         # Select rule tier based on risk category
         tier_key = f"{score.risk_category}_risk"
-        tier = rules.get(tier_key)
+        tier: Optional[_RuleTier] = getattr(rules, tier_key)
         if tier is None:
             logger.warning("No %s tier in rules for trait %s", tier_key, score.trait)
             return None
 
-        nutrient = rules.get("nutrient", score.trait)
-        base_dri = self._get_dri(nutrient, age, sex)
+        nutrient = rules.nutrient if rules.nutrient is not None else score.trait
+        base_dri, unit = self._resolve_dri(nutrient, age, sex)
 
         if base_dri is None:
             logger.warning("No DRI found for nutrient %s (age=%d, sex=%s)", nutrient, age, sex)
             return None
 
-        multiplier = tier.get("dri_multiplier", 1.0)
-        recommended = round(base_dri * multiplier, 1)
+        recommended = round(base_dri * tier.dri_multiplier, 1)
 
         # Build the reason string
-        description = tier.get("description", "")
-        supplementation = tier.get("supplementation", "")
-        reason = description
-        if supplementation and supplementation != "Not applicable":
-            reason = f"{description} {supplementation}"
+        reason = tier.description
+        if tier.supplementation and tier.supplementation != "Not applicable":
+            reason = f"{tier.description} {tier.supplementation}"
 
-        return DietaryRecommendation(
+        return DietaryRecommendation.model_construct(
             nutrient=nutrient,
             current_dri=base_dri,
             recommended_intake=recommended,
-            unit=self._get_dri_unit(nutrient),
+            unit=unit,
             adjustment_reason=reason,
-            food_sources=tier.get("food_sources", []),
-            priority=tier.get("priority", "medium"),
+            food_sources=list(tier.food_sources),
+            priority=tier.priority,
             evidence_level=self._get_evidence_level(score),
         )
 
-    def _get_dri(self, nutrient: str, age: int, sex: str) -> Optional[float]:
-        """Look up Chinese DRI for a nutrient by age and sex.
+    def _resolve_dri(
+        self, nutrient: str, age: int, sex: str
+    ) -> Tuple[Optional[float], str]:
+        """Look up Chinese DRI value and unit for a nutrient by age and sex.
 
         Args:
-            nutrient: Nutrient key from chinese_dri.yaml.
+            nutrient: Nutrient name from recommendation rules.
             age: Age in years.
             sex: 'male' or 'female'.
 
         Returns:
-            DRI value or None if not found.
+            Tuple of (DRI value or None if not found, unit string).
         """
-        # Map recommendation nutrient names to DRI config keys
-        nutrient_map = {
-            "folate": "folate",
-            "energy_balance": "energy",
-            "dietary_fat": "dietary_fat",
-            "omega3_omega6": "omega3_epa_dha",
-            "carbohydrate": "carbohydrate",
-            "vitamin_a": "vitamin_a",
-            "insulin_sensitivity": "protein",  # proxy: general metabolic
-            "macronutrient_preference": "carbohydrate",
-            "vitamin_d_calcium": "vitamin_d",
-        }
-
-        dri_key = nutrient_map.get(nutrient, nutrient)
-        nutrient_data = self.dri.get(dri_key)
-        if nutrient_data is None:
-            return None
-
-        age_group = _age_to_group(age)
-        lookup_key = f"adult_{sex}_{age_group}"
-        value = nutrient_data.get(lookup_key)
-
-        if value is None:
-            # Fallback: try without age group
-            fallback_key = f"adult_{sex}_18_49"
-            value = nutrient_data.get(fallback_key)
-
-        return value
-
-    def _get_dri_unit(self, nutrient: str) -> str:
-        """Get unit string for a nutrient from DRI config."""
-        nutrient_map = {
-            "folate": "folate",
-            "energy_balance": "energy",
-            "dietary_fat": "dietary_fat",
-            "omega3_omega6": "omega3_epa_dha",
-            "carbohydrate": "carbohydrate",
-            "vitamin_a": "vitamin_a",
-            "insulin_sensitivity": "protein",
-            "macronutrient_preference": "carbohydrate",
-            "vitamin_d_calcium": "vitamin_d",
-        }
-        dri_key = nutrient_map.get(nutrient, nutrient)
-        nutrient_data = self.dri.get(dri_key)
-        if nutrient_data is None:
-            return "units"
-        return nutrient_data.get("unit", "units")
+        dri_key = _NUTRIENT_TO_DRI_KEY.get(nutrient, nutrient)
+        value = self._dri_values.get((dri_key, sex, _age_to_group(age)))
+        return value, self._dri_units.get(dri_key, "units")
 
     @staticmethod
     def _get_evidence_level(score: RiskScore) -> str:
@@ -248,15 +255,68 @@ class RecommendationEngine:
         return mapping.get(score.confidence, "B")
 
 
+def _build_trait_plan(kb: GeneNutrientKnowledgeBase) -> Dict[str, _TraitPlan]:
+    """Join trait variants, gene keys, and validated rules per trait.
+
+    Raises:
+        ConfigValidationError: If a gene's recommendation rules are invalid.
+    """
+    plan: Dict[str, _TraitPlan] = {}
+    for trait, rsids in TRAIT_VARIANT_MAP.items():
+        gene_key = TRAIT_GENE_KEY.get(trait)
+        raw_rules = kb.get_recommendation_rules(gene_key) if gene_key else None
+        rules = None
+        if raw_rules is not None:
+            try:
+                rules = _GeneRules.model_validate(raw_rules)
+            except ValidationError as e:
+                raise ConfigValidationError(
+                    f"Recommendation rules for {gene_key} validation failed: {e}"
+                ) from e
+        plan[trait] = (rsids, gene_key, rules)
+    return plan
+
+
+def _build_dri_tables(
+    dri: dict,
+) -> Tuple[Dict[Tuple[str, str, str], float], Dict[str, str]]:
+    """Flatten the DRI config into direct lookup tables.
+
+    Returns:
+        Tuple of (values keyed by (dri_key, sex, age_group), units keyed by
+        dri_key). Missing age-group values fall back to the 18-49 value.
+
+    Raises:
+        ConfigValidationError: If a unit or adult DRI value is invalid.
+    """
+    values: Dict[Tuple[str, str, str], float] = {}
+    units: Dict[str, str] = {}
+    for dri_key, nutrient_data in dri.items():
+        try:
+            units[dri_key] = _DRI_UNIT_ADAPTER.validate_python(
+                nutrient_data.get("unit", "units")
+            )
+            for sex in ("male", "female"):
+                fallback = nutrient_data.get(f"adult_{sex}_18_49")
+                for age_group in _AGE_GROUPS:
+                    value = nutrient_data.get(f"adult_{sex}_{age_group}")
+                    if value is None:
+                        value = fallback
+                    if value is not None:
+                        values[(dri_key, sex, age_group)] = (
+                            _DRI_VALUE_ADAPTER.validate_python(value)
+                        )
+        except ValidationError as e:
+            raise ConfigValidationError(
+                f"DRI entry {dri_key} validation failed: {e}"
+            ) from e
+    return values, units
+
+
 def _age_to_group(age: int) -> str:
     """Convert age to Chinese DRI age group string.
 
     Age groups per Chinese DRI 2022:
         18-49, 50-64, 65+
     """
-    if age < 50:
-        return "18_49"
-    elif age < 65:
-        return "50_64"
-    else:
-        return "65_plus"
+    return _AGE_GROUPS[bisect.bisect_right(_AGE_GROUP_LOWER_BOUNDS, age)]
@@ -4,13 +4,14 @@ Calculates single-gene and polygenic risk scores from genotype data,
 normalized against East Asian population allele frequencies.
 """
 
+import bisect
 import logging
 import math
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from src.utils.exceptions import RiskScoringError
 
-from .data_models import GeneticProfile, RiskScore
+from .data_models import GeneNutrientPair, GeneticProfile, RiskScore, SNPGenotype
 from .knowledge_base import GeneNutrientKnowledgeBase
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,7 @@ logger = logging.getLogger(__name__)
 #   e2: rs429358=T, rs7412=T
 #   e3: rs429358=T, rs7412=C  (reference/most common)
 #   e4: rs429358=C, rs7412=C
+# Keys use canonical (alphabetically sorted) genotypes, see _CANONICAL_GENOTYPE
 APOE_EPSILON_MAP = {
     ("TT", "TT"): "e2/e2",
     ("TT", "CT"): "e2/e3",
@@ -27,10 +29,6 @@ APOE_EPSILON_MAP = {
     ("CT", "CC"): "e3/e4",
     ("CC", "CC"): "e4/e4",
     ("CT", "CT"): "e2/e4",
-    # Reversed order handling
-    ("TT", "TC"): "e2/e3",
-    ("TC", "CC"): "e3/e4",
-    ("TC", "TC"): "e2/e4",
 }
 
 # Risk levels for APOE epsilon genotypes (0=low, 1=moderate, 2=high)
@@ -43,17 +41,32 @@ APOE_RISK_LEVELS = {
     "e2/e4": 1,
 }
 
+# Approximate z-score per APOE risk level, for consistency with other traits
+_APOE_RISK_Z = (-0.8, 0.0, 1.2)
+
+# All genotypes accepted by SNPGenotype.genotype (pattern ^[ACGT]{2}$)
+_DIPLOID_GENOTYPES = tuple(a + b for a in "ACGT" for b in "ACGT")
+
+# Genotype -> allele-order-independent form, e.g. "TC" -> "CT"
+_CANONICAL_GENOTYPE = {gt: "".join(sorted(gt)) for gt in _DIPLOID_GENOTYPES}
+
+_SQRT2 = math.sqrt(2.0)
+
+# z < -0.5 is low, -0.5 <= z < 0.5 is moderate, z >= 0.5 is high
+_RISK_CATEGORIES = ("low", "moderate", "high")
+_RISK_CATEGORY_CUTS = (-0.5, 0.5)
+
 # Trait-to-variant mappings for polygenic scoring
 TRAIT_VARIANT_MAP = {
-    "obesity": ["rs9939609", "rs17782313", "rs12970134"],
-    "folate_metabolism": ["rs1801133", "rs1801131"],
-    "fatty_acid_metabolism": ["rs174547", "rs498793"],
-    "lipid_metabolism": ["rs429358", "rs7412"],
-    "type2_diabetes": ["rs7903146"],
-    "vitamin_a_conversion": ["rs12934922"],
-    "metabolic_health": ["rs1501299"],
-    "sweet_preference": ["rs838133"],
-    "bone_health": ["rs2228570"],
+    "obesity": ("rs9939609", "rs17782313", "rs12970134"),
+    "folate_metabolism": ("rs1801133", "rs1801131"),
+    "fatty_acid_metabolism": ("rs174547", "rs498793"),
+    "lipid_metabolism": ("rs429358", "rs7412"),
+    "type2_diabetes": ("rs7903146",),
+    "vitamin_a_conversion": ("rs12934922",),
+    "metabolic_health": ("rs1501299",),
+    "sweet_preference": ("rs838133",),
+    "bone_health": ("rs2228570",),
 }
 
 # Map trait → gene key (for recommendation lookup)
@@ -82,6 +95,50 @@ class RiskScoringEngine:
 
     def __init__(self, knowledge_base: GeneNutrientKnowledgeBase) -> None:
         self.kb = knowledge_base
+        # rsID -> {genotype: z-score} over all 16 diploid genotypes
+        self._genotype_z: Dict[str, Dict[str, float]] = {}
+        # rsID -> {genotype: RiskScore fields} with score, percentile and
+        # category folded in, so single-gene scoring is a pair of dict lookups
+        self._single_gene_fields: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for rsid in knowledge_base.get_all_tracked_rsids():
+            pair = knowledge_base.get_pair_by_rsid(rsid)
+            if pair is not None:
+                slope, intercept = _z_coefficients(pair)
+                z_by_genotype = {
+                    gt: slope * gt.count(pair.risk_allele) + intercept
+                    for gt in _DIPLOID_GENOTYPES
+                }
+                self._genotype_z[rsid] = z_by_genotype
+                trait = f"{pair.gene}_{pair.nutrient}"
+                confidence = "high" if pair.evidence_level in ("A", "B") else "medium"
+                self._single_gene_fields[rsid] = {
+                    gt: {
+                        "trait": trait,
+                        "score": round(z, 4),
+                        "percentile": _z_to_percentile(z),
+                        "risk_category": _categorize_risk(z),
+                        "contributing_variants": (rsid,),
+                        "confidence": confidence,
+                    }
+                    for gt, z in z_by_genotype.items()
+                }
+        # (rs429358, rs7412) genotype pair in either allele order ->
+        # (z-score, percentile, risk category) for every recognized combination
+        self._apoe_scores: Dict[Tuple[str, str], Tuple[float, float, str]] = {}
+        for gt_429358 in _DIPLOID_GENOTYPES:
+            for gt_7412 in _DIPLOID_GENOTYPES:
+                epsilon = APOE_EPSILON_MAP.get(
+                    (_CANONICAL_GENOTYPE[gt_429358], _CANONICAL_GENOTYPE[gt_7412])
+                )
+                if epsilon is None:
+                    continue
+                risk_level = APOE_RISK_LEVELS.get(epsilon, 1)
+                z_score = _APOE_RISK_Z[risk_level]
+                self._apoe_scores[(gt_429358, gt_7412)] = (
+                    z_score,
+                    _z_to_percentile(z_score),
+                    _RISK_CATEGORIES[risk_level],
+                )
 
     def calculate_single_gene_risk(
         self, profile: GeneticProfile, rsid: str
@@ -96,7 +153,8 @@ class RiskScoringEngine:
             rsid: SNP identifier (e.g., 'rs1801133').
 
         Returns:
-            RiskScore or None if variant not in profile.
+            RiskScore, or None if variant not in profile or its genotype is
+            not a valid diploid call.
 
         Raises:
             RiskScoringError: If rsid not in knowledge base.
@@ -108,56 +166,85 @@ class RiskScoringEngine:
             )
             return None
 
-        pair = self.kb.get_pair_by_rsid(rsid)
-        if pair is None:
+        fields_by_genotype = self._single_gene_fields.get(rsid)
+        if fields_by_genotype is None:
             raise RiskScoringError(f"rsID {rsid} not in knowledge base")
+        fields = fields_by_genotype.get(genotype.genotype)
+        if fields is None:
+            _warn_invalid_genotype(profile, genotype)
+            return None
+        return RiskScore.model_construct(**fields)
 
-        risk_allele_count = genotype.genotype.count(pair.risk_allele)
-        raw_score = pair.effect_size.value * risk_allele_count
+    def _raw_z_for_rsid(
+        self,
+        profile: GeneticProfile,
+        genotypes: Mapping[str, SNPGenotype],
+        rsid: str,
+    ) -> Optional[float]:
+        """Return the z-score for one variant without building a RiskScore.
 
-        # Population-normalized z-score (additive model)
-        p = pair.allele_freq_east_asian
-        expected = 2 * p * pair.effect_size.value
-        variance = 2 * p * (1 - p) * pair.effect_size.value ** 2
-        std_dev = math.sqrt(variance) if variance > 0 else 1.0
-        z_score = (raw_score - expected) / std_dev
+        Args:
+            profile: Individual genetic profile.
+            genotypes: The profile's rsID index (profile.genotypes_by_rsid()).
+            rsid: SNP identifier.
 
-        percentile = _z_to_percentile(z_score)
-        risk_category = _categorize_risk(z_score)
+        Returns:
+            Unrounded z-score, or None if variant not in profile or its
+            genotype is not a valid diploid call.
 
-        return RiskScore(
-            trait=f"{pair.gene}_{pair.nutrient}",
-            score=round(z_score, 4),
-            percentile=percentile,
-            risk_category=risk_category,
-            contributing_variants=[rsid],
-            confidence="high" if pair.evidence_level in ("A", "B") else "medium",
-        )
+        Raises:
+            RiskScoringError: If rsid not in knowledge base.
+        """
+        genotype = genotypes.get(rsid)
+        if genotype is None:
+            logger.warning(
+                "rsID %s not found in profile %s", rsid, profile.individual_id
+            )
+            return None
+
+        z_by_genotype = self._genotype_z.get(rsid)
+        if z_by_genotype is None:
+            raise RiskScoringError(f"rsID {rsid} not in knowledge base")
+        z_score = z_by_genotype.get(genotype.genotype)
+        if z_score is None:
+            _warn_invalid_genotype(profile, genotype)
+        return z_score
 
     def calculate_polygenic_risk(
-        self, profile: GeneticProfile, trait: str, rsids: List[str]
+        self, profile: GeneticProfile, trait: str, rsids: Sequence[str]
     ) -> Optional[RiskScore]:
         """Calculate combined polygenic risk score across multiple variants.
 
         Args:
             profile: Individual genetic profile.
             trait: Trait name (e.g., 'obesity').
-            rsids: List of rsIDs to include.
+            rsids: rsIDs to include.
 
         Returns:
             Combined RiskScore, or None if no valid variants found.
         """
+        return self._score_trait(profile, profile.genotypes_by_rsid(), trait, rsids)
+
+    def _score_trait(
+        self,
+        profile: GeneticProfile,
+        genotypes: Mapping[str, SNPGenotype],
+        trait: str,
+        rsids: Sequence[str],
+    ) -> Optional[RiskScore]:
+        """Score one trait against an already-resolved profile rsID index."""
         # Special handling for APOE
         if trait == "lipid_metabolism":
-            return self._score_apoe(profile)
+            return self._score_apoe(profile, genotypes)
 
         scores: List[float] = []
         contributing: List[str] = []
 
         for rsid in rsids:
-            result = self.calculate_single_gene_risk(profile, rsid)
-            if result is not None:
-                scores.append(result.score)
+            z_score = self._raw_z_for_rsid(profile, genotypes, rsid)
+            if z_score is not None:
+                # Same precision as the per-variant RiskScore.score
+                scores.append(round(z_score, 4))
                 contributing.append(rsid)
 
         if not scores:
@@ -167,16 +254,18 @@ class RiskScoringEngine:
         percentile = _z_to_percentile(combined)
         risk_category = _categorize_risk(combined)
 
-        return RiskScore(
+        return RiskScore.model_construct(
             trait=trait,
             score=round(combined, 4),
             percentile=percentile,
             risk_category=risk_category,
-            contributing_variants=contributing,
+            contributing_variants=tuple(contributing),
             confidence="high" if len(contributing) >= 2 else "medium",
         )
 
-    def _score_apoe(self, profile: GeneticProfile) -> Optional[RiskScore]:
+    def _score_apoe(
+        self, profile: GeneticProfile, genotypes: Mapping[str, SNPGenotype]
+    ) -> Optional[RiskScore]:
         """Determine APOE epsilon genotype and assign risk category.
 
         APOE is special: two SNPs (rs429358, rs7412) define three alleles
@@ -185,12 +274,13 @@ class RiskScoringEngine:
 
         Args:
             profile: Individual genetic profile.
+            genotypes: The profile's rsID index (profile.genotypes_by_rsid()).
 
         Returns:
             RiskScore for lipid metabolism, or None if APOE SNPs missing.
         """
-        gt_429358 = profile.get_genotype_by_rsid("rs429358")
-        gt_7412 = profile.get_genotype_by_rsid("rs7412")
+        gt_429358 = genotypes.get("rs429358")
+        gt_7412 = genotypes.get("rs7412")
 
         if gt_429358 is None or gt_7412 is None:
             logger.warning(
@@ -198,25 +288,22 @@ class RiskScoringEngine:
             )
             return None
 
-        key = (gt_429358.genotype, gt_7412.genotype)
-        epsilon = APOE_EPSILON_MAP.get(key)
-
-        if epsilon is None:
+        scores = self._apoe_scores.get((gt_429358.genotype, gt_7412.genotype))
+        if scores is None:
+            key = (
+                _CANONICAL_GENOTYPE.get(gt_429358.genotype, gt_429358.genotype),
+                _CANONICAL_GENOTYPE.get(gt_7412.genotype, gt_7412.genotype),
+            )
             logger.warning("Unrecognized APOE genotype combination: %s", key)
             return None
 
-        risk_level = APOE_RISK_LEVELS.get(epsilon, 1)
-        risk_category = {0: "low", 1: "moderate", 2: "high"}[risk_level]
-
-        # Convert to approximate z-score for consistency
-        z_score = {0: -0.8, 1: 0.0, 2: 1.2}[risk_level]
-
-        return RiskScore(
+        z_score, percentile, risk_category = scores
+        return RiskScore.model_construct(
             trait="lipid_metabolism",
             score=z_score,
-            percentile=_z_to_percentile(z_score),
+            percentile=percentile,
             risk_category=risk_category,
-            contributing_variants=["rs429358", "rs7412"],
+            contributing_variants=("rs429358", "rs7412"),
             confidence="high",
         )
 
@@ -231,27 +318,66 @@ class RiskScoringEngine:
         Returns:
             List of RiskScore objects for all traits with available data.
         """
+        return self.score_traits(profile, TRAIT_VARIANT_MAP.items())
+
+    def score_traits(
+        self,
+        profile: GeneticProfile,
+        traits: Iterable[Tuple[str, Sequence[str]]],
+    ) -> List[RiskScore]:
+        """Calculate polygenic risk scores for several traits at once.
+
+        Builds the profile's rsID index once and shares it across traits.
+
+        Args:
+            profile: Individual genetic profile.
+            traits: (trait name, rsIDs) pairs to score.
+
+        Returns:
+            List of RiskScore objects for traits with available data.
+        """
         results: List[RiskScore] = []
+        genotypes = profile.genotypes_by_rsid()
 
-        for trait, rsids in TRAIT_VARIANT_MAP.items():
-            result = self.calculate_polygenic_risk(profile, trait, rsids)
+        for trait, rsids in traits:
+            result = self._score_trait(profile, genotypes, trait, rsids)
             if result is not None:
                 results.append(result)
 
         return results
 
 
+def _z_coefficients(pair: GeneNutrientPair) -> Tuple[float, float]:
+    """Precompute the population-normalized z-score as a linear function.
+
+    Additive model: raw = effect * count, z = (raw - expected) / std_dev,
+    with expected = 2p * effect and variance = 2p(1-p) * effect^2 for East
+    Asian risk allele frequency p. Rearranged as z = slope * count + intercept.
+    """
+    effect = pair.effect_size.value
+    p = pair.allele_freq_east_asian
+    expected = 2 * p * effect
+    variance = 2 * p * (1 - p) * effect ** 2
+    std_dev = math.sqrt(variance) if variance > 0 else 1.0
+    return effect / std_dev, -expected / std_dev
+
+
+def _warn_invalid_genotype(profile: GeneticProfile, genotype: SNPGenotype) -> None:
+    """Log a genotype outside the 16 diploid ACGT calls, which cannot be scored."""
+    logger.warning(
+        "Invalid genotype %r for %s in profile %s",
+        genotype.genotype,
+        genotype.rsid,
+        profile.individual_id,
+    )
+
+
 def _z_to_percentile(z_score: float) -> float:
     """Convert z-score to percentile (0-100) using error function."""
-    percentile = 50 * (1 + math.erf(z_score / math.sqrt(2)))
+    percentile = 50 * (1 + math.erf(z_score / _SQRT2))
     return round(percentile, 2)
 
 
 def _categorize_risk(z_score: float) -> str:
     """Categorize risk based on z-score thresholds."""
-    if z_score < -0.5:
-        return "low"
-    elif z_score < 0.5:
-        return "moderate"
-    else:
-        return "high"
+    return _RISK_CATEGORIES[bisect.bisect_right(_RISK_CATEGORY_CUTS, z_score)]
@@ -13,10 +13,57 @@ from .data_models import GeneticProfile, SNPGenotype
 
 logger = logging.getLogger(__name__)
 
+# Genotypes with a quality score below this are flagged as low quality
+_DEFAULT_MIN_QUALITY = 20.0
+
 
 class GeneticDataValidator:
     """Validate genetic data quality and consistency."""
 
+    @staticmethod
+    def is_genotype_consistent(genotype: SNPGenotype) -> bool:
+        """Return whether the observed genotype matches reference/alternate alleles.
+
+        Non-raising form of validate_genotype_consistency for bulk checks.
+
+        Args:
+            genotype: SNPGenotype to check.
+
+        Returns:
+            True if both observed alleles are the reference or alternate allele.
+        """
+        obs = genotype.genotype
+        ref = genotype.reference_allele
+        alt = genotype.alternate_allele
+        # Same result as obs in {ref+ref, ref+alt, alt+ref, alt+alt} for the
+        # two-character genotypes SNPGenotype accepts, without building strings
+        return (
+            len(obs) == 2
+            and (obs[0] == ref or obs[0] == alt)
+            and (obs[1] == ref or obs[1] == alt)
+        )
+
+    @staticmethod
+    def is_genotype_low_quality(
+        genotype: SNPGenotype, min_quality: float = _DEFAULT_MIN_QUALITY
+    ) -> bool:
+        """Return whether a genotype's quality score is below the threshold.
+
+        Logs a warning for each genotype flagged as low quality.
+
+        Args:
+            genotype: SNPGenotype to check.
+            min_quality: Minimum acceptable quality score.
+
+        Returns:
+            True if the genotype has a quality score below min_quality.
+        """
+        quality = genotype.quality_score
+        if quality is None or quality >= min_quality:
+            return False
+        logger.warning("Low quality genotype: %s (Q=%.1f)", genotype.rsid, quality)
+        return True
+
     @staticmethod
     def validate_genotype_consistency(genotype: SNPGenotype) -> bool:
         """Check that observed genotype matches reference/alternate alleles.
@@ -30,15 +77,10 @@ class GeneticDataValidator:
         Raises:
             GeneticDataValidationError: If genotype is inconsistent.
         """
-        ref = genotype.reference_allele
-        alt = genotype.alternate_allele
-        obs = genotype.genotype
-
-        valid_genotypes = {ref + ref, ref + alt, alt + ref, alt + alt}
-
-        if obs not in valid_genotypes:
+        if not GeneticDataValidator.is_genotype_consistent(genotype):
             raise GeneticDataValidationError(
-                f"Genotype '{obs}' inconsistent with ref={ref}, alt={alt} "
+                f"Genotype '{genotype.genotype}' inconsistent with "
+                f"ref={genotype.reference_allele}, alt={genotype.alternate_allele} "
                 f"for {genotype.rsid}"
             )
         return True
@@ -56,7 +98,7 @@ class GeneticDataValidator:
         Returns:
             Dict mapping rsID to presence (True/False).
         """
-        available = {g.rsid for g in profile.genotypes}
+        available = profile.rsids()
         return {rsid: rsid in available for rsid in required_rsids}
 
     @staticmethod
@@ -72,12 +114,12 @@ class GeneticDataValidator:
         Returns:
             List of missing rsIDs.
         """
-        available = {g.rsid for g in profile.genotypes}
+        available = profile.rsids()
         return [rsid for rsid in required_rsids if rsid not in available]
 
     @staticmethod
     def flag_low_quality_genotypes(
-        profile: GeneticProfile, min_quality: float = 20.0
+        profile: GeneticProfile, min_quality: float = _DEFAULT_MIN_QUALITY
     ) -> List[str]:
         """Identify genotypes below quality threshold.
 
@@ -88,19 +130,11 @@ class GeneticDataValidator:
         Returns:
             List of low-quality rsIDs.
         """
-        low_quality = []
-        for genotype in profile.genotypes:
-            if (
-                genotype.quality_score is not None
-                and genotype.quality_score < min_quality
-            ):
-                low_quality.append(genotype.rsid)
-                logger.warning(
-                    "Low quality genotype: %s (Q=%.1f)",
-                    genotype.rsid,
-                    genotype.quality_score,
-                )
-        return low_quality
+        return [
+            genotype.rsid
+            for genotype in profile.genotypes
+            if GeneticDataValidator.is_genotype_low_quality(genotype, min_quality)
+        ]
 
     @staticmethod
     def validate_profile(
@@ -117,13 +151,14 @@ class GeneticDataValidator:
             inconsistent (list).
         """
         missing = GeneticDataValidator.get_missing_rsids(profile, required_rsids)
-        low_quality = GeneticDataValidator.flag_low_quality_genotypes(profile)
 
+        # Quality and consistency checks share a single pass over genotypes
+        low_quality: List[str] = []
         inconsistent: List[str] = []
         for genotype in profile.genotypes:
-            try:
-                GeneticDataValidator.validate_genotype_consistency(genotype)
-            except GeneticDataValidationError:
+            if GeneticDataValidator.is_genotype_low_quality(genotype):
+                low_quality.append(genotype.rsid)
+            if not GeneticDataValidator.is_genotype_consistent(genotype):
                 inconsistent.append(genotype.rsid)
 
         is_valid = len(inconsistent) == 0 and len(profile.genotypes) > 0
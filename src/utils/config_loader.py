@@ -1,8 +1,12 @@
 """Configuration file loading utilities."""
 
+import copy
+import functools
 import logging
+import os
+import pickle
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import yaml
 
@@ -10,6 +14,13 @@ from .exceptions import ConfigValidationError
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it, else the pure-Python one
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Set to "1" to cache parsed configs in a "<name>.yaml.pkl" file beside each
+# YAML file. Off by default: only enable where the config directory is trusted.
+_CACHE_ENV_VAR = "NUTRIGENE_YAML_CACHE"
+
 
 def load_yaml_config(config_path: Path) -> Dict[str, Any]:
     """Load and parse a YAML configuration file.
@@ -18,22 +29,79 @@ def load_yaml_config(config_path: Path) -> Dict[str, Any]:
         config_path: Path to YAML file.
 
     Returns:
-        Parsed configuration dictionary.
+        Parsed configuration dictionary, owned by the caller. Parsing is
+        cached per file path, modification time, and size; each call returns
+        a fresh copy of the cached result.
 
     Raises:
         ConfigValidationError: If file not found or invalid YAML.
     """
-    if not config_path.exists():
-        raise ConfigValidationError(f"Config file not found: {config_path}")
+    try:
+        stat = config_path.stat()
+    except OSError:
+        raise ConfigValidationError(f"Config file not found: {config_path}") from None
+    config = _load_yaml_cached(config_path.resolve(), stat.st_mtime_ns, stat.st_size)
+    # Copying is ~10x cheaper than parsing and keeps callers from mutating
+    # the shared cached tree
+    return copy.deepcopy(config)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_yaml_cached(
+    config_path: Path, mtime_ns: int, size: int
+) -> Dict[str, Any]:
+    """Parse a config file once per (path, mtime, size); see load_yaml_config."""
+    use_cache = os.environ.get(_CACHE_ENV_VAR) == "1"
+    if use_cache:
+        cached = _read_cache(config_path)
+        if cached is not None:
+            logger.debug("Loaded cached config for %s", config_path)
+            return cached
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        with open(config_path, "rb") as f:
+            config = yaml.load(f, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise ConfigValidationError(f"Invalid YAML in {config_path}: {e}") from e
 
     if config is None:
         raise ConfigValidationError(f"Empty config file: {config_path}")
 
+    if use_cache:
+        _write_cache(config_path, config)
+
     logger.debug("Loaded config from %s", config_path)
     return config
+
+
+def _cache_path(config_path: Path) -> Path:
+    """Return the pickle sidecar path for a YAML config."""
+    return config_path.with_name(config_path.name + ".pkl")
+
+
+def _read_cache(config_path: Path) -> Optional[Dict[str, Any]]:
+    """Return the pickled config if its sidecar is not older than the YAML."""
+    cache_path = _cache_path(config_path)
+    try:
+        if cache_path.stat().st_mtime_ns < config_path.stat().st_mtime_ns:
+            return None
+        with open(cache_path, "rb") as f:
+            config: Dict[str, Any] = pickle.load(f)
+        return config
+    except (OSError, EOFError, pickle.UnpicklingError) as e:
+        if not isinstance(e, FileNotFoundError):
+            logger.debug("Ignoring unreadable config cache %s: %s", cache_path, e)
+        return None
+
+
+def _write_cache(config_path: Path, config: Dict[str, Any]) -> None:
+    """Atomically write the pickle sidecar; failures only skip caching."""
+    cache_path = _cache_path(config_path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+        tmp_path.unlink(missing_ok=True)
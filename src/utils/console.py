@@ -0,0 +1,21 @@
+"""Console output helpers for command-line entry points."""
+
+import sys
+
+
+def ensure_utf8_stdout() -> None:
+    """Switch stdout to UTF-8 on Windows so Chinese characters display correctly.
+
+    Call this at the start of CLI entry points that print report text; library
+    imports deliberately do not touch the process's IO streams. Does nothing on
+    other platforms, when stdout is already UTF-8, or when stdout is not a
+    reconfigurable text stream (e.g. conda run pipes).
+    """
+    if sys.platform != "win32" or not hasattr(sys.stdout, "reconfigure"):
+        return
+    if (sys.stdout.encoding or "").lower().replace("-", "") == "utf8":
+        return
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except (OSError, ValueError):
+        pass
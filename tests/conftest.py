@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from src.models.genetic_risk.data_models import GeneticProfile, SNPGenotype
+from src.models.genetic_risk.data_models import GeneticProfile
 from src.models.genetic_risk.knowledge_base import GeneNutrientKnowledgeBase
 from src.models.genetic_risk.risk_scoring import RiskScoringEngine
 from src.utils.config_loader import load_yaml_config
@@ -14,15 +14,15 @@ CONFIGS_DIR = Path(__file__).parent.parent / "configs"
 KB_DIR = CONFIGS_DIR / "gene_nutrient_kb"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def kb() -> GeneNutrientKnowledgeBase:
-    """Load the gene-nutrient knowledge base."""
+    """Load the gene-nutrient knowledge base (read-only, shared by all tests)."""
     return GeneNutrientKnowledgeBase(KB_DIR)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def scorer(kb: GeneNutrientKnowledgeBase) -> RiskScoringEngine:
-    """Create a scoring engine."""
+    """Create a scoring engine (stateless, shared by all tests)."""
     return RiskScoringEngine(kb)
 
 
@@ -30,12 +30,11 @@ def _load_profile(name: str) -> GeneticProfile:
     """Load a test profile from fixtures YAML."""
     data = load_yaml_config(FIXTURES_DIR / "sample_genotypes.yaml")
     raw = data[name]
-    genotypes = [SNPGenotype(**g) for g in raw["genotypes"]]
-    return GeneticProfile(
+    return GeneticProfile.from_records(
+        raw["genotypes"],
         individual_id=raw["individual_id"],
         population=raw["population"],
         data_source=raw["data_source"],
-        genotypes=genotypes,
     )
 
 
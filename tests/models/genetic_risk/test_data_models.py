@@ -98,11 +98,75 @@ class TestGeneticProfile:
     ) -> None:
         assert high_risk_profile.get_genotype_by_rsid("rs999999") is None
 
+    def test_get_genotype_after_append(
+        self, high_risk_profile: GeneticProfile
+    ) -> None:
+        assert high_risk_profile.get_genotype_by_rsid("rs999999") is None
+        extra = SNPGenotype(
+            rsid="rs999999",
+            chromosome="1",
+            position=1,
+            reference_allele="A",
+            alternate_allele="G",
+            genotype="AG",
+        )
+        high_risk_profile.genotypes.append(extra)
+        assert high_risk_profile.get_genotype_by_rsid("rs999999") is extra
+
+    def test_rsids_tracks_append(self, high_risk_profile: GeneticProfile) -> None:
+        assert "rs1801133" in high_risk_profile.rsids()
+        assert "rs999999" not in high_risk_profile.rsids()
+        high_risk_profile.genotypes.append(
+            SNPGenotype(rsid="rs999999", chromosome="1", position=1, genotype="AG")
+        )
+        assert "rs999999" in high_risk_profile.rsids()
+
+    def test_lookups_track_replaced_element(
+        self, high_risk_profile: GeneticProfile
+    ) -> None:
+        i = high_risk_profile.get_available_rsids().index("rs1801133")
+        assert high_risk_profile.get_genotype_by_rsid("rs1801133") is not None
+        assert "rs1801133" in high_risk_profile.rsids()
+        high_risk_profile.genotypes[i] = SNPGenotype(
+            rsid="rs999999", chromosome="1", position=1, genotype="AG"
+        )
+        assert high_risk_profile.get_genotype_by_rsid("rs1801133") is None
+        assert "rs1801133" not in high_risk_profile.rsids()
+        assert "rs1801133" not in high_risk_profile.genotypes_by_rsid()
+
+    def test_lookups_leave_no_instance_state(
+        self, high_risk_profile: GeneticProfile
+    ) -> None:
+        copy = high_risk_profile.model_copy(deep=True)
+        high_risk_profile.get_genotype_by_rsid("rs1801133")
+        high_risk_profile.genotypes_by_rsid()
+        assert "rs1801133" in high_risk_profile.rsids()
+        # pydantic < 2.6 compares the whole instance __dict__ in __eq__
+        assert high_risk_profile.__dict__ == copy.__dict__
+        assert high_risk_profile == copy
+
     def test_get_available_rsids(self, high_risk_profile: GeneticProfile) -> None:
         rsids = high_risk_profile.get_available_rsids()
         assert "rs1801133" in rsids
         assert "rs9939609" in rsids
 
+    def test_from_records_json(self) -> None:
+        profile = GeneticProfile.from_records(
+            '[{"rsid": "rs1801133", "chromosome": "1", "position": 11856378,'
+            ' "genotype": "CT"}]',
+            individual_id="JSON_001",
+        )
+        assert profile.individual_id == "JSON_001"
+        g = profile.get_genotype_by_rsid("rs1801133")
+        assert g is not None and g.genotype == "CT"
+
+    def test_from_records_rejects_bad_genotype(self) -> None:
+        with pytest.raises(ValidationError):
+            GeneticProfile.from_records(
+                [{"rsid": "rs1801133", "chromosome": "1", "position": 1,
+                  "genotype": "XY"}]
+            )
+
     def test_empty_genotypes_rejected(self) -> None:
         with pytest.raises(ValidationError):
             GeneticProfile(
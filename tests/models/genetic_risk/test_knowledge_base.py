@@ -4,7 +4,10 @@ from pathlib import Path
 
 import pytest
 
-from src.models.genetic_risk.knowledge_base import GeneNutrientKnowledgeBase
+from src.models.genetic_risk.knowledge_base import (
+    GeneNutrientKnowledgeBase,
+    load_knowledge_base,
+)
 from src.utils.exceptions import KnowledgeBaseError
 
 
@@ -91,3 +94,9 @@ class TestKnowledgeBase:
         south = kb.get_allele_freq("MTHFR_C677T", "han_chinese_south")
         assert north is not None and south is not None
         assert north > south  # Known north-south gradient
+
+    def test_load_knowledge_base_shared(self) -> None:
+        kb_dir = Path(__file__).parents[3] / "configs" / "gene_nutrient_kb"
+        first = load_knowledge_base(kb_dir)
+        assert load_knowledge_base(kb_dir / ".." / "gene_nutrient_kb") is first
+        assert first.pair_count > 0
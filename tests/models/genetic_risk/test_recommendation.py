@@ -1,5 +1,6 @@
 """Tests for dietary recommendation engine."""
 
+import copy
 from pathlib import Path
 
 import pytest
@@ -8,7 +9,7 @@ from src.models.genetic_risk.data_models import GeneticProfile, GeneticRiskRepor
 from src.models.genetic_risk.knowledge_base import GeneNutrientKnowledgeBase
 from src.models.genetic_risk.recommendation import RecommendationEngine, _age_to_group
 from src.models.genetic_risk.risk_scoring import RiskScoringEngine
-from src.utils.exceptions import RecommendationError
+from src.utils.exceptions import ConfigValidationError, RecommendationError
 
 CONFIGS_DIR = Path(__file__).parent.parent.parent.parent / "configs"
 
@@ -126,6 +127,40 @@ class TestInputValidation:
             recommender.generate_report(high_risk_profile, age=-1, sex="male")
 
 
+class TestConfigValidation:
+    """Tests for validation of recommendation rules and DRI config at init."""
+
+    def test_invalid_rule_priority_raises(
+        self,
+        kb: GeneNutrientKnowledgeBase,
+        scorer: RiskScoringEngine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        rules = copy.deepcopy(kb.get_recommendation_rules("MTHFR"))
+        rules["high_risk"]["priority"] = "urgent"
+        monkeypatch.setattr(
+            kb,
+            "get_recommendation_rules",
+            lambda gene: rules if gene == "MTHFR" else None,
+        )
+        with pytest.raises(ConfigValidationError, match="MTHFR"):
+            RecommendationEngine(kb, scorer, CONFIGS_DIR / "chinese_dri.yaml")
+
+    def test_invalid_dri_value_raises(
+        self,
+        kb: GeneNutrientKnowledgeBase,
+        scorer: RiskScoringEngine,
+        tmp_path: Path,
+    ) -> None:
+        dri = tmp_path / "dri.yaml"
+        dri.write_text(
+            'folate:\n  unit: "μg DFE/day"\n  adult_male_18_49: plenty\n',
+            encoding="utf-8",
+        )
+        with pytest.raises(ConfigValidationError, match="folate"):
+            RecommendationEngine(kb, scorer, dri)
+
+
 class TestAgeGroupMapping:
     """Tests for DRI age group mapping."""
 
@@ -164,3 +199,23 @@ class TestReportSerialization:
         summary = report.to_summary()
         assert "individual_id" in summary
         assert summary["n_risk_scores"] > 0
+
+
+class TestModuleShortcut:
+    """Tests for the package-level generate_report shortcut."""
+
+    def test_engine_reused_across_calls(
+        self, high_risk_profile: GeneticProfile
+    ) -> None:
+        from src.models.genetic_risk import _cached_engine, generate_report
+
+        _cached_engine.cache_clear()
+        first = generate_report(high_risk_profile, age=30, sex="male")
+        second = generate_report(
+            high_risk_profile,
+            age=30,
+            sex="male",
+            dri_path=CONFIGS_DIR / "chinese_dri.yaml",
+        )
+        assert _cached_engine.cache_info().misses == 1
+        assert len(first.recommendations) == len(second.recommendations)
@@ -14,29 +14,56 @@ from src.utils.exceptions import RiskScoringError
 class TestSingleGeneScoring:
     """Tests for single-gene risk score calculation."""
 
-    def test_mthfr_tt_is_high_risk(
-        self, scorer: RiskScoringEngine, high_risk_profile: GeneticProfile
-    ) -> None:
-        score = scorer.calculate_single_gene_risk(high_risk_profile, "rs1801133")
+    @pytest.mark.parametrize(
+        "profile_fixture,expected",
+        [
+            ("high_risk_profile", "high"),  # TT
+            ("moderate_risk_profile", "moderate"),  # CT
+            ("low_risk_profile", "low"),  # CC
+        ],
+    )
+    def test_mthfr_risk_category(
+        self,
+        scorer: RiskScoringEngine,
+        request: pytest.FixtureRequest,
+        profile_fixture: str,
+        expected: str,
+    ) -> None:
+        profile = request.getfixturevalue(profile_fixture)
+        score = scorer.calculate_single_gene_risk(profile, "rs1801133")
         assert score is not None
-        assert score.risk_category == "high"
-        assert score.score > 0
+        assert score.risk_category == expected
         assert score.confidence == "high"  # Evidence level A
 
-    def test_mthfr_cc_is_low_risk(
+    def test_rescoring_sees_replaced_genotype(
         self, scorer: RiskScoringEngine, low_risk_profile: GeneticProfile
     ) -> None:
+        from src.models.genetic_risk.data_models import SNPGenotype
+
         score = scorer.calculate_single_gene_risk(low_risk_profile, "rs1801133")
-        assert score is not None
-        assert score.risk_category == "low"
-        assert score.score < 0
+        assert score is not None and score.risk_category == "low"
+        i = low_risk_profile.get_available_rsids().index("rs1801133")
+        low_risk_profile.genotypes[i] = SNPGenotype(
+            rsid="rs1801133", chromosome="1", position=11796321, genotype="TT"
+        )
+        score = scorer.calculate_single_gene_risk(low_risk_profile, "rs1801133")
+        assert score is not None and score.risk_category == "high"
+        folate = scorer.calculate_polygenic_risk(
+            low_risk_profile, "folate_metabolism", ["rs1801133"]
+        )
+        assert folate is not None and folate.risk_category == "high"
 
-    def test_mthfr_ct_is_moderate(
-        self, scorer: RiskScoringEngine, moderate_risk_profile: GeneticProfile
+    def test_invalid_genotype_returns_none(
+        self, scorer: RiskScoringEngine, high_risk_profile: GeneticProfile
     ) -> None:
-        score = scorer.calculate_single_gene_risk(moderate_risk_profile, "rs1801133")
-        assert score is not None
-        assert score.risk_category == "moderate"
+        # In-place assignment bypasses the model's genotype pattern
+        high_risk_profile.get_genotype_by_rsid("rs1801133").genotype = "NN"
+        assert scorer.calculate_single_gene_risk(high_risk_profile, "rs1801133") is None
+        folate = scorer.calculate_polygenic_risk(
+            high_risk_profile, "folate_metabolism", ["rs1801133", "rs1801131"]
+        )
+        assert folate is not None
+        assert folate.contributing_variants == ("rs1801131",)
 
     def test_missing_rsid_returns_none(
         self, scorer: RiskScoringEngine, low_risk_profile: GeneticProfile
@@ -125,33 +152,54 @@ class TestPolygenicScoring:
 class TestAPOEScoring:
     """Tests for APOE epsilon genotype determination."""
 
-    def test_apoe_e4_e4_high_risk(
-        self, scorer: RiskScoringEngine, high_risk_profile: GeneticProfile
-    ) -> None:
+    @pytest.mark.parametrize(
+        "profile_fixture,expected",
+        [
+            ("high_risk_profile", "high"),  # e4/e4
+            ("moderate_risk_profile", "moderate"),  # e3/e4
+            ("low_risk_profile", "low"),  # e3/e3
+        ],
+    )
+    def test_apoe_risk_category(
+        self,
+        scorer: RiskScoringEngine,
+        request: pytest.FixtureRequest,
+        profile_fixture: str,
+        expected: str,
+    ) -> None:
+        profile = request.getfixturevalue(profile_fixture)
         score = scorer.calculate_polygenic_risk(
-            high_risk_profile, "lipid_metabolism", ["rs429358", "rs7412"]
+            profile, "lipid_metabolism", ["rs429358", "rs7412"]
         )
         assert score is not None
-        assert score.risk_category == "high"
+        assert score.risk_category == expected
         assert "rs429358" in score.contributing_variants
 
-    def test_apoe_e3_e4_moderate(
-        self, scorer: RiskScoringEngine, moderate_risk_profile: GeneticProfile
-    ) -> None:
+    @pytest.mark.parametrize("gt_429358,gt_7412", [("CT", "TC"), ("TC", "CT")])
+    def test_apoe_allele_order_ignored(
+        self,
+        scorer: RiskScoringEngine,
+        moderate_risk_profile: GeneticProfile,
+        gt_429358: str,
+        gt_7412: str,
+    ) -> None:
+        # Neither allele order was a key of APOE_EPSILON_MAP before normalization
+        moderate_risk_profile.get_genotype_by_rsid("rs429358").genotype = gt_429358
+        moderate_risk_profile.get_genotype_by_rsid("rs7412").genotype = gt_7412
         score = scorer.calculate_polygenic_risk(
             moderate_risk_profile, "lipid_metabolism", ["rs429358", "rs7412"]
         )
         assert score is not None
-        assert score.risk_category == "moderate"
+        assert score.risk_category == "moderate"  # e2/e4
 
-    def test_apoe_e3_e3_low(
-        self, scorer: RiskScoringEngine, low_risk_profile: GeneticProfile
+    def test_apoe_invalid_genotype_returns_none(
+        self, scorer: RiskScoringEngine, moderate_risk_profile: GeneticProfile
     ) -> None:
+        moderate_risk_profile.get_genotype_by_rsid("rs7412").genotype = "C"
         score = scorer.calculate_polygenic_risk(
-            low_risk_profile, "lipid_metabolism", ["rs429358", "rs7412"]
+            moderate_risk_profile, "lipid_metabolism", ["rs429358", "rs7412"]
         )
-        assert score is not None
-        assert score.risk_category == "low"
+        assert score is None
 
 
 class TestScoreAllTraits:
@@ -191,3 +239,7 @@ class TestHelpers:
         assert _categorize_risk(-1.0) == "low"
         assert _categorize_risk(0.0) == "moderate"
         assert _categorize_risk(1.0) == "high"
+
+    def test_categorize_risk_boundaries(self) -> None:
+        assert _categorize_risk(-0.5) == "moderate"
+        assert _categorize_risk(0.5) == "high"
@@ -0,0 +1,91 @@
+"""Tests for genetic data validators."""
+
+import pytest
+
+from src.models.genetic_risk.data_models import GeneticProfile, SNPGenotype
+from src.models.genetic_risk.validators import GeneticDataValidator
+from src.utils.exceptions import GeneticDataValidationError
+
+
+def _snp(rsid: str, genotype: str, quality: float = 99.0) -> SNPGenotype:
+    """Build a C/T SNP genotype for validator tests."""
+    return SNPGenotype(
+        rsid=rsid,
+        chromosome="1",
+        position=1,
+        reference_allele="C",
+        alternate_allele="T",
+        genotype=genotype,
+        quality_score=quality,
+    )
+
+
+class TestGenotypeConsistency:
+    """Tests for per-genotype allele consistency."""
+
+    @pytest.mark.parametrize("genotype", ["CC", "CT", "TC", "TT"])
+    def test_consistent_genotypes(self, genotype: str) -> None:
+        assert GeneticDataValidator.validate_genotype_consistency(
+            _snp("rs1", genotype)
+        )
+
+    def test_is_genotype_consistent_does_not_raise(self) -> None:
+        assert GeneticDataValidator.is_genotype_consistent(_snp("rs1", "TC"))
+        assert not GeneticDataValidator.is_genotype_consistent(_snp("rs1", "AG"))
+
+    def test_inconsistent_genotype_raises(self) -> None:
+        with pytest.raises(GeneticDataValidationError, match="rs1"):
+            GeneticDataValidator.validate_genotype_consistency(_snp("rs1", "AG"))
+
+
+class TestQuality:
+    """Tests for per-genotype quality checks."""
+
+    def test_is_genotype_low_quality(self) -> None:
+        assert GeneticDataValidator.is_genotype_low_quality(_snp("rs1", "CT", 15.0))
+        assert not GeneticDataValidator.is_genotype_low_quality(_snp("rs1", "CT", 20.0))
+        assert GeneticDataValidator.is_genotype_low_quality(
+            _snp("rs1", "CT", 25.0), min_quality=30.0
+        )
+
+
+class TestCompleteness:
+    """Tests for required-variant presence checks."""
+
+    def test_profile_completeness(self, partial_profile: GeneticProfile) -> None:
+        result = GeneticDataValidator.validate_profile_completeness(
+            partial_profile, ["rs1801133", "rs9939609"]
+        )
+        assert result == {"rs1801133": True, "rs9939609": False}
+
+
+class TestValidateProfile:
+    """Tests for the combined profile validation summary."""
+
+    def test_complete_profile_valid(
+        self, high_risk_profile: GeneticProfile
+    ) -> None:
+        required = high_risk_profile.get_available_rsids()
+        result = GeneticDataValidator.validate_profile(high_risk_profile, required)
+        assert result["valid"] is True
+        assert result["missing"] == []
+        assert result["inconsistent"] == []
+        assert result["coverage"] == 1.0
+
+    def test_partial_profile_summary(self, partial_profile: GeneticProfile) -> None:
+        required = ["rs1801133", "rs9939609", "rs429358", "rs7412"]
+        result = GeneticDataValidator.validate_profile(partial_profile, required)
+        assert result["missing"] == ["rs9939609", "rs429358", "rs7412"]
+        assert result["low_quality"] == ["rs1801133"]  # Q=15
+        assert result["total_variants"] == 1
+        assert result["coverage"] == 0.25
+
+    def test_inconsistent_genotypes_reported(self) -> None:
+        profile = GeneticProfile(
+            genotypes=[_snp("rs1", "CT"), _snp("rs2", "AG"), _snp("rs3", "GG", 10.0)]
+        )
+        result = GeneticDataValidator.validate_profile(profile, ["rs1", "rs4"])
+        assert result["valid"] is False
+        assert result["inconsistent"] == ["rs2", "rs3"]
+        assert result["low_quality"] == ["rs3"]
+        assert result["missing"] == ["rs4"]
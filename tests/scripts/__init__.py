@@ -0,0 +1 @@
+"""Script tests."""
@@ -0,0 +1,132 @@
+"""Tests for the quality scoring script."""
+
+import json
+import os
+import subprocess
+import sys
+import warnings
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from scripts import quality_score
+
+SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "quality_score.py"
+GOLDEN = Path(__file__).parent / "fixtures" / "quality_score_golden.json"
+
+# Stand-in for Rscript: records its argv and reports every file containing
+# "<<<" as a parse error, using the same "<index>\t<error>" protocol.
+RSCRIPT_STUB = f"""#!{sys.executable}
+import json
+import os
+import sys
+
+args = sys.argv[1:]
+with open(os.environ["RSCRIPT_STUB_LOG"], "w") as log:
+    json.dump(args, log)
+for i, name in enumerate(args[2:], 1):
+    with open(name, "rb") as f:
+        error = "unexpected input" if b"<<<" in f.read() else ""
+    print(f"{{i}}\\t{{error}}")
+"""
+
+FIXTURE_TREE: Dict[str, str] = {
+    "clean.py": (
+        '"""Clean module."""\n'
+        "\n\n"
+        "def add(a: int, b: int) -> int:\n"
+        '    """Add two numbers."""\n'
+        "    return a + b\n"
+    ),
+    "issues.py": (
+        '"""Module with issues."""\n'
+        "\n"
+        'DATA_DIR = "/home/user/data"\n'
+        'password = "hunter2"\n'
+        "\n\n"
+        "def load(path):\n"
+        "    return open(path).read()\n"
+        "\n\n"
+        "class Loader:\n"
+        "    def run(self) -> None:\n"
+        '        """Run."""\n'
+        "\n"
+        "    def _helper(self):\n"
+        "        pass\n"
+    ),
+    "broken.py": "def f(:\n    pass\n",
+    "analysis.R": 'x <- rnorm(10)\nwrite.csv(x, "/home/user/out.csv")\n',
+    "seeded.R": "set.seed(20240101)\nx <- runif(5)\n",
+    "bad.R": "x <- <<<\n",
+}
+
+
+@pytest.fixture
+def rscript_stub(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Put a stub Rscript first on PATH; returns the file its argv is logged to."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    stub = bin_dir / "Rscript"
+    stub.write_text(RSCRIPT_STUB)
+    stub.chmod(0o755)
+    log = tmp_path / "rscript_argv.json"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("RSCRIPT_STUB_LOG", str(log))
+    return log
+
+
+@pytest.fixture
+def fixture_tree(tmp_path: Path) -> Path:
+    """Write the fixture sources to a fresh directory."""
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    for name, source in FIXTURE_TREE.items():
+        (tree / name).write_text(source)
+    return tree
+
+
+def test_parse_python_suppresses_syntax_warnings() -> None:
+    """Sources that only raise compiler warnings parse without warning."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        tree, error = quality_score.IssueDetector.parse_python(
+            b'x = "\\d"\nif x is "a":\n    pass\n', Path("w.py")
+        )
+    assert tree is not None
+    assert error == ""
+
+
+def test_parse_python_reports_compile_errors() -> None:
+    """Errors the parser accepts but the compiler rejects are reported."""
+    tree, error = quality_score.IssueDetector.parse_python(b"return 1\n", Path("r.py"))
+    assert tree is None
+    assert error == "'return' outside function at line 1"
+
+
+def test_r_syntax_batch_argv_and_parsing(
+    rscript_stub: Path, fixture_tree: Path
+) -> None:
+    """Files follow the -e expression directly and each status line is mapped."""
+    files = [fixture_tree / "seeded.R", fixture_tree / "bad.R"]
+    results = quality_score.IssueDetector.check_r_syntax_batch(files)
+
+    argv = json.loads(rscript_stub.read_text())
+    assert argv == ["-e", quality_score._R_BATCH_PARSE, *map(str, files)]
+    assert results == {
+        files[0]: (True, ""),
+        files[1]: (False, "unexpected input"),
+    }
+
+
+def test_golden_json_report(rscript_stub: Path, fixture_tree: Path) -> None:
+    """Multi-file --json output matches the recorded golden report."""
+    result = subprocess.run(
+        [sys.executable, str(SCRIPT), *FIXTURE_TREE, "--json"],
+        cwd=fixture_tree,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 2
+    assert json.loads(result.stdout) == json.loads(GOLDEN.read_text())
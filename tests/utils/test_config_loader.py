@@ -1,9 +1,11 @@
 """Tests for YAML config loader utility."""
 
+import os
 from pathlib import Path
 
 import pytest
 
+from src.utils import config_loader
 from src.utils.config_loader import load_yaml_config
 from src.utils.exceptions import ConfigValidationError
 
@@ -39,3 +41,76 @@ def test_dri_has_required_nutrients() -> None:
     for nutrient in required:
         assert nutrient in dri, f"Missing nutrient: {nutrient}"
         assert "unit" in dri[nutrient], f"Missing unit for {nutrient}"
+
+
+def _count_yaml_parses(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Record each yaml.load call made by the config loader."""
+    calls: list = []
+    real_load = config_loader.yaml.load
+
+    def counting_load(*args, **kwargs):
+        calls.append(args)
+        return real_load(*args, **kwargs)
+
+    monkeypatch.setattr(config_loader.yaml, "load", counting_load)
+    return calls
+
+
+def test_yaml_cache_sidecar(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """With NUTRIGENE_YAML_CACHE=1 a pickle sidecar is written and reused."""
+    monkeypatch.setenv("NUTRIGENE_YAML_CACHE", "1")
+    parses = _count_yaml_parses(monkeypatch)
+    config = tmp_path / "example.yaml"
+    config.write_text("folate:\n  unit: μg DFE\n", encoding="utf-8")
+
+    first = load_yaml_config(config)
+    assert (tmp_path / "example.yaml.pkl").exists()
+    assert len(parses) == 1
+
+    # Bypass the in-process cache so the second load must use the sidecar
+    config_loader._load_yaml_cached.cache_clear()
+    assert load_yaml_config(config) == first == {"folate": {"unit": "μg DFE"}}
+    assert len(parses) == 1
+
+    # A newer YAML file invalidates the sidecar
+    config.write_text("energy:\n  unit: kcal\n", encoding="utf-8")
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert "energy" in load_yaml_config(config)
+    assert len(parses) == 2
+
+
+def test_yaml_cache_disabled_by_default(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """No sidecar is written unless the cache is enabled."""
+    monkeypatch.delenv("NUTRIGENE_YAML_CACHE", raising=False)
+    config = tmp_path / "example.yaml"
+    config.write_text("folate:\n  unit: μg DFE\n", encoding="utf-8")
+    load_yaml_config(config)
+    assert not (tmp_path / "example.yaml.pkl").exists()
+
+
+def test_repeat_load_is_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Unchanged files are parsed once; edits are picked up."""
+    parses = _count_yaml_parses(monkeypatch)
+    config = tmp_path / "example.yaml"
+    config.write_text("folate:\n  unit: μg DFE\n", encoding="utf-8")
+    first = load_yaml_config(config)
+    assert load_yaml_config(config) == first
+    assert len(parses) == 1
+
+    config.write_text("energy:\n  unit: kcal\n", encoding="utf-8")
+    assert "energy" in load_yaml_config(config)
+
+
+def test_loaded_config_is_caller_owned(tmp_path: Path) -> None:
+    """Mutating a loaded config does not affect later loads."""
+    config = tmp_path / "example.yaml"
+    config.write_text("folate:\n  unit: μg DFE\n", encoding="utf-8")
+    first = load_yaml_config(config)
+    first["folate"]["unit"] = "mg"
+    first["energy"] = {}
+    assert load_yaml_config(config) == {"folate": {"unit": "μg DFE"}}